@@ -1,9 +1,12 @@
-import json
 import argparse
+import json
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
+import ijson
+import orjson
 from loguru import logger
 
 from src.evaluation.evaluation import evaluate_direct_mapping, evaluate_mapping_function
@@ -27,53 +30,98 @@ def init_loguru(run_dir: str):
     )
 
 
-def reset_run_dir(run_dir: str):
-    # delete the plots directory
-    plots_dir = os.path.join(run_dir, "plots")
-    if os.path.exists(plots_dir):
-        shutil.rmtree(plots_dir)
-
-    # delete the metrics.json file
-    file_name = os.path.join(run_dir, "metrics.json")
-    if os.path.exists(file_name):
-        os.remove(file_name)
-
-    # delete the wrong_samples.json file
-    file_name = os.path.join(run_dir, "wrong_samples.json")
-    if os.path.exists(file_name):
-        os.remove(file_name)
-
-    # delete the parsed_functions directory
-    parsed_fns_dir = os.path.join(run_dir, "parsed_functions")
-    if os.path.exists(parsed_fns_dir):
-        shutil.rmtree(parsed_fns_dir)
-        return
-
-    # convert every .json in raw_results back to .jsonl
-    raw_results_dir = os.path.join(run_dir, "raw_results")
-    for filename in os.listdir(raw_results_dir):
-        if not filename.endswith(".json"):
-            continue
-
-        json_file_path = os.path.join(raw_results_dir, filename)
-        with open(json_file_path, "r") as f:
-            data = json.load(f)
+def _convert_one(json_file_path: str):
+    """Converts a raw results .json file back to .jsonl and removes the original.
+
+    Args:
+        json_file_path (str): The path to the .json file.
+    """
+    jsonl_file_path = json_file_path[: -len(".json")] + ".jsonl"
+
+    # Both paths write the lines with json.dumps, the format the pipeline itself
+    # writes raw results in, so all .jsonl files of a run look the same
+    try:
+        # stream the items, so only one result is held in memory at a time
+        with open(json_file_path, "rb") as fi, open(jsonl_file_path, "w") as fo:
+            for item in ijson.items(fi, "item", use_float=True):
+                fo.write(json.dumps(item) + "\n")
+    except ijson.JSONError:
+        # ijson rejects the NaN/Infinity literals that json.dump writes for
+        # non-finite floats, the json module reads and writes them back unchanged
+        logger.warning(f"Converting {json_file_path} with the json module")
+        try:
+            with open(json_file_path, "r") as f:
+                data = json.load(f)
+        except ValueError as e:
+            _remove_file(jsonl_file_path)
+            raise ValueError(f"Failed to convert {json_file_path}: {e}") from e
 
-        jsonl_file_path = os.path.join(
-            raw_results_dir, filename.replace(".json", ".jsonl")
-        )
         with open(jsonl_file_path, "w") as f:
             for item in data:
                 f.write(json.dumps(item) + "\n")
 
-        os.remove(json_file_path)
+    os.remove(json_file_path)
+
+
+def _remove_file(path: str):
+    """Removes a file, ignoring it if it does not exist.
+
+    Args:
+        path (str): The path of the file.
+    """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_dir(path: str) -> bool:
+    """Removes a directory tree, ignoring it if it does not exist.
+
+    Args:
+        path (str): The path of the directory.
+
+    Returns:
+        bool: True if the directory existed and was removed, False otherwise.
+    """
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return False
+
+    return True
+
+
+def reset_run_dir(run_dir: str):
+    # delete the plots directory and the evaluation outputs
+    _remove_dir(os.path.join(run_dir, "plots"))
+    _remove_file(os.path.join(run_dir, "metrics.json"))
+    _remove_file(os.path.join(run_dir, "wrong_samples.json"))
+
+    # delete the parsed_functions directory, the raw results need no conversion then
+    if _remove_dir(os.path.join(run_dir, "parsed_functions")):
+        return
+
+    # runs evaluated before the raw results were kept as .jsonl still contain .json
+    # files, convert them back to .jsonl, one file per worker
+    raw_results_dir = os.path.join(run_dir, "raw_results")
+    with os.scandir(raw_results_dir) as it:
+        json_paths = [
+            entry.path
+            for entry in it
+            if entry.name.endswith(".json") and entry.is_file(follow_symlinks=False)
+        ]
+
+    max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_convert_one, json_paths))
 
 
 def run_evaluation(run_dir: str):
     # Load the configuration file
     config_file = os.path.join(run_dir, "config.json")
-    with open(config_file, "r") as f:
-        config = json.load(f)
+    with open(config_file, "rb") as f:
+        config = orjson.loads(f.read())
 
     prompt: PromptType = config["prompt"]
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
 class BlockchainConnector(ABC):
@@ -17,6 +18,35 @@ class BlockchainConnector(ABC):
         """
         pass
 
+    def call_store_metrics_batch(
+        self, payloads: dict[str, dict], single_tx: bool = False
+    ) -> dict[str, str]:
+        """Call the Smart Contracts for storing metrics for multiple machines.
+
+        By default, `call_store_metrics` is called for all machines concurrently.
+        Connectors that can store all payloads in a single transaction override this
+        method to support `single_tx`.
+
+        Args:
+            payloads (dict[str, dict]): Mapping of machine IDs to their JSON payloads.
+            single_tx (bool): Whether to store all payloads in a single transaction.
+
+        Returns:
+            dict[str, str]: Mapping of machine IDs to the generated transaction IDs.
+        """
+        if single_tx:
+            raise NotImplementedError(
+                f"{type(self).__name__} does not support single transaction batches."
+            )
+
+        with ThreadPoolExecutor(max_workers=len(payloads) or 1) as executor:
+            calls = executor.map(
+                self.call_store_metrics, payloads.keys(), payloads.values()
+            )
+            tx_ids = list(calls)
+
+        return dict(zip(payloads.keys(), tx_ids))
+
     @abstractmethod
     def call_aggregate_metrics(self, date_str: str) -> str:
         """Call the Smart Contract for aggregating metrics for a specific date.
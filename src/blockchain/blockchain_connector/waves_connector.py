@@ -1,14 +1,55 @@
-import json
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import orjson
 import pywaves as pw
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from loguru import logger
 
 from src.blockchain.blockchain_connector import BlockchainConnector
 
+# Minimum fee of an invokeScript transaction in wavelets (0.005 WAVES)
+INVOKE_FEE = 500000
+
+
+@lru_cache(maxsize=256)
+def _address_from_seed(seed: str) -> pw.Address:
+    """Derive the Waves address of a seed once and reuse it across connector instances.
+    All connectors use the testnet chain, so the seed alone identifies the address.
+    """
+    return pw.Address(seed=seed)
+
+
+@lru_cache(maxsize=None)
+def _load_addresses(path: str) -> dict:
+    """Parse an addresses file once, as it is static configuration."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _stringify(value):
+    """Recursively convert all non-string values of a nested structure to strings."""
+    if isinstance(value, dict):
+        return {k: _stringify(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_stringify(v) for v in value]
+    elif not isinstance(value, str):
+        return str(value)
+    return value
+
+
+def _may_be_number(value: str) -> bool:
+    """Cheap check that rules out strings which can never parse to a finite float, so
+    that categorical values like dates or states skip the exception path.
+    """
+    head = value.lstrip()[:1]
+    return head.isdigit() or head in ("+", "-", ".")
+
 
 class WavesConnector(BlockchainConnector):
     """Connector implementation for the Waves blockchain."""
@@ -21,136 +62,351 @@ class WavesConnector(BlockchainConnector):
         pw.setNode(node=self.__node_url, chain_id="T")
         pw.setChain("testnet")
 
+        self.__init_session()
         self.__init_addresses()
 
+    def __init_session(self):
+        """Initialize a persistent HTTP session, so connections to the node are reused."""
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+
+        self.__session = requests.Session()
+        self.__session.headers.update({"Accept": "application/json"})
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+
+    def close(self):
+        """Close the HTTP session of the connector."""
+        self.__session.close()
+
     def __init_addresses(self):
         """Initialize addresses for the caller, machines, and aggregate."""
-        self.__caller_address = pw.Address(seed=os.getenv("SEED"))
+        self.__caller_address = _address_from_seed(os.getenv("SEED"))
 
         addresses_path = os.path.join(
             os.path.dirname(os.path.abspath(__file__)), "waves_addresses.json"
         )
 
-        with open(addresses_path, "r") as f:
-            machine_addresses = json.load(f)
+        machine_addresses = _load_addresses(addresses_path)
 
         self.__machine_addresses: dict[str, pw.Address] = {}
 
         for i, data in enumerate(machine_addresses["machines"]):
             machine_id = f"M{i+1:03d}"
             seed = data["seedPhrase"]
-            self.__machine_addresses[machine_id] = pw.Address(seed=seed)
+            self.__machine_addresses[machine_id] = _address_from_seed(seed)
 
         seed = machine_addresses["aggregated"]["seedPhrase"]
-        self.__aggregate_address = pw.Address(seed=seed)
+        self.__aggregate_address = _address_from_seed(seed)
 
-    def __scale_floats(self, data: dict, factor: int = 100) -> dict:
-        """Helper function to scale float values in the dictionary by a given factor.
-        This is necessary because Waves Smart Contracts do not support float values.
+    def __prepare_values(self, data: dict, factor: int = 100) -> dict:
+        """Helper function to scale numeric values by a given factor and to convert all
+        other non-string values to strings, in a single pass over the dictionary.
+        This is necessary because Waves Smart Contracts do not support float values
+        and only accept string values.
 
         Args:
-            data (dict): The dictionary containing float values to scale.
-            factor (int): The factor by which to scale the float values. Default is 100.
+            data (dict): The dictionary containing the values to prepare.
+            factor (int): The factor by which to scale the numeric values. Default is 100.
 
         Returns:
-            dict: A new dictionary with float values scaled to integers.
+            dict: A new dictionary with scaled integers and all other values as strings.
         """
+        prepared = {}
+
+        for key, value in data.items():
+            if isinstance(value, str) and not _may_be_number(value):
+                prepared[key] = value
+                continue
 
-        def scale(value):
             try:
-                float_val = float(value)
-                scaled_val = int(float_val * factor)
-                return str(scaled_val)
+                prepared[key] = str(int(float(value) * factor))
             except (ValueError, TypeError):
-                return value
+                # Nested containers are the only values that need a deeper walk
+                prepared[key] = value if isinstance(value, str) else _stringify(value)
 
-        return {k: scale(v) for k, v in data.items()}
+        return prepared
 
-    def __stringify_values(self, data: dict) -> dict:
-        """Helper function to convert all non-string values in a dictionary to strings.
-        This is necessary because Waves Smart Contracts only accept string values.
+    def __get_tx_info(self, tx_id: str) -> dict | None:
+        """Helper function to fetch transaction information from the Waves blockchain.
 
         Args:
-            data (dict): The dictionary containing values to stringify.
+            tx_id (str): The transaction ID to fetch information for.
 
         Returns:
-            dict: A new dictionary with all non-string values converted to strings.
+            dict: A dictionary containing transaction information, or None if not found.
         """
+        api_url = f"{self.__node_url}/transactions/info/{tx_id}"
 
-        def stringify(value):
-            if isinstance(value, dict):
-                return {k: stringify(v) for k, v in value.items()}
-            elif isinstance(value, list):
-                return [stringify(v) for v in value]
-            elif not isinstance(value, str):
-                return str(value)
-            return value
-
-        return stringify(data)
+        try:
+            response = self.__session.get(api_url, timeout=5)
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            if e.response is None or e.response.status_code != 404:
+                logger.error(f"Error fetching transaction data: {e}")
+            return None
 
-    def __get_tx_info(self, tx_id: str) -> dict | None:
-        """Helper function to fetch transaction information from the Waves blockchain.
+    def __get_tx_statuses(self, tx_ids: list[str]) -> list[dict] | None:
+        """Helper function to fetch the status of multiple transactions in one request.
+        The status is "confirmed" (including the height), "unconfirmed" while the
+        transaction is in the unconfirmed pool, or "not_found".
 
         Args:
-            tx_id (str): The transaction ID to fetch information for.
+            tx_ids (list[str]): The transaction IDs to fetch the status for.
 
         Returns:
-            dict: A dictionary containing transaction information, or None if not found.
+            list[dict]: The statuses in the order of `tx_ids`, or None if the request failed.
         """
-        api_url = f"{self.__node_url}/transactions/info/{tx_id}"
+        api_url = f"{self.__node_url}/transactions/status"
 
         try:
-            response = requests.get(api_url)
+            response = self.__session.post(api_url, json={"ids": tx_ids}, timeout=5)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
-            if response.status_code != 404:
-                logger.error(f"Error fetching transaction data: {e}")
+            # transient while polling, the next poll retries
+            logger.debug(f"Error fetching transaction statuses: {e}")
             return None
 
-    def wait_for_transaction(self, tx_id: str, timeout: int = 60, interval: int = 1):
+    def wait_for_transaction(
+        self,
+        tx_id: str,
+        timeout: int = 60,
+        interval: float = 0.25,
+        max_interval: float = 5,
+        backoff: float = 1.6,
+        max_missing: int = 5,
+    ):
         """Wait for a transaction to be confirmed on the Waves blockchain.
 
+        The transaction is polled as described in `wait_for_transactions`, and its
+        full information is fetched once it is confirmed.
+
         Args:
             tx_id (str): The transaction ID to wait for.
             timeout (int): The maximum time to wait for confirmation in seconds. Default is 60 seconds.
-            interval (int): The interval between checks in seconds. Default is 1 second.
+            interval (float): The initial interval between checks in seconds. Default is 0.25 seconds.
+            max_interval (float): The maximum interval between checks in seconds. Default is 5 seconds.
+            backoff (float): The factor the interval grows by after each miss. Default is 1.6.
+            max_missing (int): The number of consecutive checks after which a transaction
+                that is neither confirmed nor unconfirmed is given up. Default is 5.
 
         Returns:
             dict: A dictionary containing transaction information if confirmed, or None if timeout is reached.
         """
-        elapsed = 0
+        status = self.wait_for_transactions(
+            [tx_id], timeout, interval, max_interval, backoff, max_missing
+        )[tx_id]
 
-        while elapsed < timeout:
-            tx_info = self.__get_tx_info(tx_id)
+        if status is None:
+            return None
 
-            if tx_info and "height" in tx_info:
-                return tx_info
+        return self.__get_tx_info(tx_id)
+
+    def wait_for_transactions(
+        self,
+        tx_ids: list[str],
+        timeout: int = 60,
+        interval: float = 0.25,
+        max_interval: float = 5,
+        backoff: float = 1.6,
+        max_missing: int = 5,
+    ) -> dict[str, dict | None]:
+        """Wait for multiple transactions to be confirmed on the Waves blockchain.
+
+        All pending transactions are checked with a single status request, which
+        covers both the blockchain and the unconfirmed pool. The first check happens
+        immediately, after that the wait time starts at `interval` and is multiplied
+        by `backoff` after each check (capped at `max_interval`). A transaction that
+        is neither confirmed nor in the unconfirmed pool for `max_missing` checks in
+        a row was rejected or dropped, so it is not waited for any longer.
+
+        Args:
+            tx_ids (list[str]): The transaction IDs to wait for.
+            timeout (int): The maximum time to wait for confirmation in seconds. Default is 60 seconds.
+            interval (float): The initial interval between checks in seconds. Default is 0.25 seconds.
+            max_interval (float): The maximum interval between checks in seconds. Default is 5 seconds.
+            backoff (float): The factor the interval grows by after each miss. Default is 1.6.
+            max_missing (int): The number of consecutive checks after which a transaction
+                that is neither confirmed nor unconfirmed is given up. Default is 5.
 
-            time.sleep(interval)
-            elapsed += interval
+        Returns:
+            dict[str, dict | None]: Mapping of transaction IDs to their status (including the height),
+                or None for transactions that were not confirmed.
+        """
+        confirmed = dict.fromkeys(tx_ids)
+        missing = dict.fromkeys(confirmed, 0)
+        pending = list(confirmed)
+
+        deadline = time.monotonic() + timeout
+        attempt = 0
+
+        while pending:
+            for status in self.__get_tx_statuses(pending) or []:
+                tx_id = status["id"]
+
+                if status["status"] == "confirmed":
+                    confirmed[tx_id] = status
+                elif status["status"] == "unconfirmed":
+                    missing[tx_id] = 0
+                else:
+                    # A broadcast may take a moment to reach the node that answers
+                    missing[tx_id] += 1
+
+            dropped = [tx_id for tx_id in pending if missing[tx_id] >= max_missing]
+            if dropped:
+                logger.warning(f"Transaction(s) not found on the node: {dropped}")
+
+            pending = [
+                tx_id
+                for tx_id in pending
+                if confirmed[tx_id] is None and missing[tx_id] < max_missing
+            ]
+            if not pending:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.warning(
+                    f"Timeout reached while waiting for {len(pending)} transaction(s)"
+                )
+                break
+
+            time.sleep(min(remaining, interval * backoff**attempt, max_interval))
+            attempt += 1
+
+        return confirmed
+
+    def __encode_payload(self, payload: dict) -> str:
+        """Helper function to encode a metrics payload for the Smart Contracts.
 
-        logger.warning("Timeout reached while waiting for transaction confirmation")
-        return None
+        Args:
+            payload (dict): The JSON payload containing the metrics data.
 
-    def call_store_metrics(self, machine_id: str, payload: dict) -> str:
+        Returns:
+            str: The compact JSON string with scaled and stringified values.
+        """
+        payload = self.__prepare_values(payload)
+        return orjson.dumps(payload).decode()
+
+    def __sign_store_metrics(self, machine_id: str, payload: dict) -> dict:
+        """Helper function to sign a `storeMetrics` transaction without broadcasting it.
+
+        Args:
+            machine_id (str): The ID of the machine to store metrics for.
+            payload (dict): The JSON payload containing the metrics data.
+
+        Returns:
+            dict: The signed invokeScript transaction.
+        """
         if machine_id not in self.__machine_addresses:
             raise ValueError(f"Invalid machine ID: {machine_id}")
 
         machine_address = self.__machine_addresses[machine_id]
 
-        payload = self.__scale_floats(payload)
-        payload = self.__stringify_values(payload)
-        payload = json.dumps(payload, separators=(",", ":"))
-
-        tx = self.__caller_address.invokeScript(
+        tx = self.__caller_address.txGenerator.generateInvokeScript(
             dappAddress=machine_address.address,
             functionName="storeMetrics",
-            params=[{"type": "string", "value": payload}],
+            publicKey=self.__caller_address.publicKey,
+            params=[{"type": "string", "value": self.__encode_payload(payload)}],
             payments=[],
         )
+        self.__caller_address.signTx(tx)
 
-        return tx["id"]
+        return tx
+
+    def __broadcast(self, tx: dict) -> str:
+        """Helper function to broadcast a signed transaction to the Waves blockchain.
+
+        Args:
+            tx (dict): The signed transaction.
+
+        Returns:
+            str: The ID of the broadcasted transaction.
+        """
+        api_url = f"{self.__node_url}/transactions/broadcast"
+
+        response = self.__session.post(
+            api_url,
+            data=orjson.dumps(tx),
+            headers={"Content-Type": "application/json"},
+            timeout=5,
+        )
+        response.raise_for_status()
+
+        return response.json()["id"]
+
+    def call_store_metrics(self, machine_id: str, payload: dict) -> str:
+        tx = self.__sign_store_metrics(machine_id, payload)
+        return self.__broadcast(tx)
+
+    def call_store_metrics_batch(
+        self, payloads: dict[str, dict], single_tx: bool = False
+    ) -> dict[str, str]:
+        """Call the Smart Contracts for storing metrics for multiple machines.
+
+        By default, one transaction per machine is signed up front and all of them
+        are broadcasted concurrently. With `single_tx`, all payloads are sent in one
+        transaction to the `storeMetricsBatch` function of the aggregate Smart
+        Contract, which invokes `storeMetrics` of every machine contract. Its fee
+        covers one invoke fee per nested call. The currently deployed aggregate
+        contract predates `storeMetricsBatch`, so `single_tx` requires redeploying
+        the scripts with `waves_setup/waves_script_setup.py` first.
+
+        Args:
+            payloads (dict[str, dict]): Mapping of machine IDs to their JSON payloads.
+            single_tx (bool): Whether to store all payloads in a single transaction.
+
+        Returns:
+            dict[str, str]: Mapping of machine IDs to the generated transaction IDs.
+                With `single_tx`, every machine maps to the same transaction ID, so
+                the machines can only be told apart by their data entries.
+        """
+        if not single_tx:
+            # Signing is CPU-bound and fast, only the broadcasts run in parallel
+            txs = [
+                self.__sign_store_metrics(machine_id, payload)
+                for machine_id, payload in payloads.items()
+            ]
+
+            with ThreadPoolExecutor(max_workers=len(txs) or 1) as executor:
+                tx_ids = list(executor.map(self.__broadcast, txs))
+
+            return dict(zip(payloads.keys(), tx_ids))
+
+        invalid_ids = payloads.keys() - self.__machine_addresses.keys()
+        if invalid_ids:
+            raise ValueError(f"Invalid machine IDs: {sorted(invalid_ids)}")
+
+        # The contract expects one entry per machine, empty strings are skipped
+        json_strs = [
+            self.__encode_payload(payloads[m_id]) if m_id in payloads else ""
+            for m_id in self.__machine_addresses
+        ]
+
+        # Every nested invoke of a machine contract is paid like a transaction of its own
+        nested_invokes = sum(1 for s in json_strs if s)
+
+        tx = self.__caller_address.invokeScript(
+            dappAddress=self.__aggregate_address.address,
+            functionName="storeMetricsBatch",
+            params=[
+                {
+                    "type": "list",
+                    "value": [{"type": "string", "value": s} for s in json_strs],
+                }
+            ],
+            payments=[],
+            txFee=INVOKE_FEE * (1 + nested_invokes),
+        )
+
+        if "error" in tx:
+            raise RuntimeError(
+                f"storeMetricsBatch was rejected by the node: {tx.get('message', tx)}"
+            )
+
+        return {machine_id: tx["id"] for machine_id in payloads}
 
     def call_aggregate_metrics(self, date_str: str) -> str:
         tx = self.__caller_address.invokeScript(
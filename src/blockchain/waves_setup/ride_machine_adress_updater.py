@@ -1,4 +1,12 @@
+import os
 import re
+import shutil
+import tempfile
+
+
+MACHINE_LINE_PATTERN = re.compile(
+    r"let machine\d+_address = Address\(base58'[A-Za-z0-9]+'\)"
+)
 
 
 class RideMachineAddressUpdater:
@@ -17,25 +25,40 @@ class RideMachineAddressUpdater:
             for i, addr in enumerate(self.machine_addresses)
         ]
 
-    def update_ride_file(self, output_path: str = None):
-        with open(self.ride_file_path, "r") as f:
-            lines = f.readlines()
-
-        new_lines = []
-        machine_line_pattern = re.compile(
-            r"let machine\d+_address = Address\(base58'[A-Za-z0-9]+'\)"
-        )
+    def rewrite_lines(self, lines):
+        machine_lines = self.generate_machine_lines()
         machine_idx = 0
 
         for line in lines:
-            if machine_line_pattern.match(line.strip()) and machine_idx < 10:
-                new_lines.append(self.generate_machine_lines()[machine_idx] + "\n")
+            stripped = line.lstrip()
+            if (
+                machine_idx < 10
+                and stripped.startswith("let machine")
+                and MACHINE_LINE_PATTERN.match(stripped)
+            ):
+                yield machine_lines[machine_idx] + "\n"
                 machine_idx += 1
             else:
-                new_lines.append(line)
+                yield line
+
+    def update_ride_file(self, output_path: str = None):
+        with open(self.ride_file_path, "r") as fin:
+            if not output_path:
+                print("".join(self.rewrite_lines(fin)))
+                return
+
+            # Stream into a temporary file next to the output and swap it in at the
+            # end, so that the input may also be updated in place
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(output_path)), suffix=".ride"
+            )
+            try:
+                with os.fdopen(fd, "w") as fout:
+                    fout.writelines(self.rewrite_lines(fin))
+            except BaseException:
+                os.remove(tmp_path)
+                raise
 
-        if output_path:
-            with open(output_path, "w") as f:
-                f.writelines(new_lines)
-        else:
-            print("".join(new_lines))
+        # mkstemp creates the file owner-only, keep the permissions of the input
+        shutil.copymode(self.ride_file_path, tmp_path)
+        os.replace(tmp_path, output_path)
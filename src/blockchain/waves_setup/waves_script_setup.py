@@ -1,19 +1,33 @@
 import os
 import time
 import random
-import string
-import json
+import secrets
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import pywaves as pw
+import requests
 from dotenv import load_dotenv
+from loguru import logger
 from ride_machine_adress_updater import RideMachineAddressUpdater
 
+# Node API errors that a retry cannot fix, all other errors are retried
+TERMINAL_NODE_ERRORS = {
+    1,  # WrongJson
+    101,  # InvalidSignature
+    102,  # InvalidAddress
+    108,  # InvalidPublicKey
+    305,  # ScriptCompilerError
+}
+
 
 class WavesScriptSetup:
     def __init__(self):
         load_dotenv()
         bank_seed = os.getenv("BANK_SEED")
 
-        pw.setNode(node="https://nodes-testnet.wavesnodes.com", chain_id="T")
+        self.node_url = "https://nodes-testnet.wavesnodes.com"
+
+        pw.setNode(node=self.node_url, chain_id="T")
         pw.setChain("testnet")
 
         self.bank_account = pw.Address(seed=bank_seed)
@@ -21,94 +35,171 @@ class WavesScriptSetup:
         self.aggregated_address = None
 
     def generate_seed_phrase(self, length=15):
-        words = [
-            "".join(random.choices(string.ascii_letters + string.digits, k=8))
-            for _ in range(length)
-        ]
+        # 6 random bytes encode to exactly 8 URL-safe base64 characters
+        words = [secrets.token_urlsafe(6) for _ in range(length)]
         return " ".join(words)
 
     def create_waves_address(self):
         seed = self.generate_seed_phrase()
-        return {"seedPhrase": seed, "address_obj": pw.Address(seed=seed)}
+        address_obj = pw.Address(seed=seed)
+        return {
+            "seedPhrase": seed,
+            "address_obj": address_obj,
+            "address": address_obj.address,
+        }
 
     def setup_addresses(self):
         for i in range(10):
-            addr_info = self.create_waves_address()
-            addr_info["address"] = addr_info["address_obj"].address
-            self.machine_addresses.append(addr_info)
+            self.machine_addresses.append(self.create_waves_address())
 
         self.aggregated_address = self.create_waves_address()
-        self.aggregated_address["address"] = self.aggregated_address[
-            "address_obj"
-        ].address
 
-        # Prepare addresses for JSON serialization
-        json_serializable = {
-            "machines": [
+        # Prepare addresses for JSON serialization and the Ride script in one pass
+        machines_json = []
+        machine_base58_list = []
+        for entry in self.machine_addresses:
+            machines_json.append(
                 {"address": entry["address"], "seedPhrase": entry["seedPhrase"]}
-                for entry in self.machine_addresses
-            ],
+            )
+            machine_base58_list.append(entry["address"])
+
+        json_serializable = {
+            "machines": machines_json,
             "aggregated": {
                 "address": self.aggregated_address["address"],
                 "seedPhrase": self.aggregated_address["seedPhrase"],
             },
         }
 
-        with open("waves_addresses.json", "w") as f:
-            json.dump(json_serializable, f, indent=4)
+        with open("waves_addresses.json", "wb") as f:
+            f.write(orjson.dumps(json_serializable, option=orjson.OPT_INDENT_2))
 
-        print("Addresses created and saved to waves_addresses.json")
+        logger.info("Addresses created and saved to waves_addresses.json")
 
         # Update aggregate Ride script with the new machine addresses
-        machine_base58_list = [entry["address"] for entry in self.machine_addresses]
         updater = RideMachineAddressUpdater("aggregate_contract.ride")
         updater.set_addresses(machine_base58_list)
         updater.update_ride_file("aggregate_contract_updated.ride")
 
     def transfer_tokens(self, address_list, amount=10000000):
-        for entry in address_list:
+        def transfer(entry):
             recip = entry["address_obj"]
             tx = self.bank_account.sendWaves(recip, amount)
-            print(f"Sent {amount} to {recip.address}: TX {tx}")
+            logger.info(f"Sent {amount} to {recip.address}: TX {tx}")
 
-    def set_script_for_address(self, address_obj, script_path):
+        # The transfers are independent, so they are broadcast concurrently
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(transfer, address_list))
+
+    def read_script(self, script_path):
         try:
             with open(script_path, "r") as file:
-                script = file.read()
+                return file.read()
         except FileNotFoundError:
             raise FileNotFoundError(f"Script file not found: {script_path}")
 
-        max_attempts = 5
+    def compile_script(self, script, script_name):
+        # Compile once on the node, the compiled script is deployed to every address
+        def compile_code():
+            response = requests.post(
+                f"{self.node_url}/utils/script/compileCode",
+                data=script.encode(),
+                headers={"Content-Type": "text/plain"},
+                timeout=30,
+            )
+            return response.json()
+
+        result = self.call_with_retries(compile_code, f"compile {script_name}")
+        logger.info(f"Compiled {script_name}, complexity: {result.get('complexity')}")
+
+        # strip the "base64:" prefix, setCompiledScript expects the bare encoding
+        return result["script"][len("base64:") :]
+
+    def set_script_for_address(self, address_obj, script_path):
+        compiled = self.compile_script(self.read_script(script_path), script_path)
+        return self.set_script(address_obj, compiled)
+
+    def set_script(self, address_obj, compiled_script):
+        tx = self.call_with_retries(
+            lambda: address_obj.setCompiledScript(compiled_script, 900000),
+            f"set script for {address_obj.address}",
+        )
+        logger.info(f"Script set successfully for {address_obj.address}, TX: {tx}")
+        return tx
+
+    def call_with_retries(self, action, description):
+        max_attempts = 7
         for attempt in range(1, max_attempts + 1):
-            tx = address_obj.setScript(script, 900000)
-            if isinstance(tx, dict) and "error" in tx:
-                print(f"Error setting script (attempt {attempt}): {tx}. Waiting 10s...")
-                time.sleep(10)
+            try:
+                result = action()
+            except (requests.ConnectionError, requests.Timeout, KeyError) as e:
+                # pywaves raises a KeyError when the node answers with an error (e.g.
+                # 429) instead of the fields it expects
+                error = e
             else:
-                print(f"Script set successfully for {address_obj.address}, TX: {tx}")
-                return tx
+                if not (isinstance(result, dict) and "error" in result):
+                    return result
+
+                if not self.is_transient_error(result):
+                    raise Exception(f"Failed to {description}: {result}")
+                error = result
+
+            if attempt == max_attempts:
+                break
+
+            # Backoff with jitter, so parallel deployments do not retry in lockstep
+            delay = min(2 ** (attempt - 1), 30) + random.random()
+            logger.warning(
+                f"Failed to {description} (attempt {attempt}): {error}. "
+                f"Waiting {delay:.1f}s..."
+            )
+            time.sleep(delay)
+
+        raise Exception(
+            f"Failed to {description} after {max_attempts} attempts: {error}"
+        )
 
-        raise Exception("Failed to set script after 5 attempts.")
+    @staticmethod
+    def is_transient_error(tx: dict) -> bool:
+        # HTTP failures are reported with their status as the error code, so rate
+        # limits (429) and server errors (5xx) are retried along with state check
+        # failures (112), e.g. while the funding transfer is still unconfirmed.
+        return tx["error"] not in TERMINAL_NODE_ERRORS
 
     def deploy_all(
         self,
         machine_script="Machine_Smart_Contracts.ride",
         aggregated_script="aggregate_contract_updated.ride",
     ):
-        print("Transferring tokens to machine addresses...")
+        # Compile the scripts once instead of once per address, before any tokens
+        # are spent on the deployment
+        logger.info("Compiling scripts...")
+        machine_compiled = self.compile_script(
+            self.read_script(machine_script), machine_script
+        )
+        aggregated_compiled = self.compile_script(
+            self.read_script(aggregated_script), aggregated_script
+        )
+
+        logger.info("Transferring tokens to machine addresses...")
         self.transfer_tokens(self.machine_addresses)
 
-        print("Transferring tokens to aggregated address...")
+        logger.info("Transferring tokens to aggregated address...")
         self.transfer_tokens([self.aggregated_address])
 
-        print("Setting machine scripts...")
-        for entry in self.machine_addresses:
-            self.set_script_for_address(entry["address_obj"], machine_script)
-
-        print("Setting aggregated script...")
-        self.set_script_for_address(
-            self.aggregated_address["address_obj"], aggregated_script
-        )
+        logger.info("Setting machine scripts...")
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(
+                executor.map(
+                    lambda entry: self.set_script(
+                        entry["address_obj"], machine_compiled
+                    ),
+                    self.machine_addresses,
+                )
+            )
+
+        logger.info("Setting aggregated script...")
+        self.set_script(self.aggregated_address["address_obj"], aggregated_compiled)
 
 
 if __name__ == "__main__":
@@ -1,12 +1,30 @@
+import mmap
 import os
-import json
 
+import orjson
 from loguru import logger
 
 from src.dataset.preparation import generate_dataset
 from src.types import Difficulty
 
 
+def _read_json_mmap(path: str):
+    """Parse a JSON file directly from a read-only memory map, so the file contents
+    are not copied into an intermediate bytes buffer first.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Returns:
+        The parsed JSON document.
+    """
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # the view must be released before the map can be closed
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
 class MappingDataset:
     def __init__(
         self,
@@ -23,19 +41,20 @@ class MappingDataset:
         """
         logger.info("Initializing dataset...")
 
-        self.difficulty = difficulty
-        self.num_samples = num_samples
+        self.difficulty: Difficulty = difficulty
+        self.num_samples: int | None = num_samples
 
-        self.dataset_path = os.path.join(cache_dir, difficulty)
+        self.dataset_path: str = os.path.join(cache_dir, difficulty)
 
         self.__load()
-        self.machine_ids: list[str] = list(self.source.keys())
+        self.machine_ids: tuple[str, ...] = tuple(self.source.keys())
         self.__validate()
 
         if self.num_samples is not None:
             self.__apply_num_samples()
 
-        self.__idx = 0
+        self.__init_columns()
+        self.__idx: int = 0
 
     def __load(self):
         src_file_path = os.path.join(self.dataset_path, "source.json")
@@ -52,18 +71,18 @@ class MappingDataset:
             logger.info(f"Storing dataset files in {self.dataset_path} ...")
 
             os.makedirs(self.dataset_path, exist_ok=True)
-            with open(src_file_path, "w") as src_file:
-                json.dump(self.source, src_file, indent=4)
-            with open(tgt_file_path, "w") as tgt_file:
-                json.dump(self.target, tgt_file, indent=4)
+            with open(src_file_path, "wb") as src_file:
+                src_file.write(orjson.dumps(self.source))
+            with open(tgt_file_path, "wb") as tgt_file:
+                tgt_file.write(orjson.dumps(self.target))
 
         else:
             logger.info(f"Loading existing dataset files from {self.dataset_path} ...")
 
-            with open(src_file_path, "r") as src_file:
-                self.source = json.load(src_file)
-            with open(tgt_file_path, "r") as tgt_file:
-                self.target = json.load(tgt_file)
+            # parse the full files even with a sample limit: it is faster than
+            # streaming and validates the whole file. The limit is applied later.
+            self.source = _read_json_mmap(src_file_path)
+            self.target = _read_json_mmap(tgt_file_path)
 
             logger.info("Dataset files loaded successfully.")
 
@@ -92,24 +111,36 @@ class MappingDataset:
             self.source[machine_id] = self.source[machine_id][: self.num_samples]
             self.target[machine_id] = self.target[machine_id][: self.num_samples]
 
+    def __init_columns(self):
+        """Arrange the samples in iteration order (round-robin over the machines) as
+        parallel columns, so that each sample is fetched with a single index.
+        """
+        samples_per_machine = len(self.source[self.machine_ids[0]])
+        self.__num_machines: int = len(self.machine_ids)
+
+        sources = (self.source[machine_id] for machine_id in self.machine_ids)
+        targets = (self.target[machine_id] for machine_id in self.machine_ids)
+
+        self.__machine_id_column = self.machine_ids * samples_per_machine
+        self.__source_column = tuple(s for day in zip(*sources) for s in day)
+        self.__target_column = tuple(t for day in zip(*targets) for t in day)
+        self.__total: int = len(self.__machine_id_column)
+
     def __len__(self):
-        return sum(len(self.source[machine_id]) for machine_id in self.machine_ids)
+        return self.__total
 
     def __iter__(self):
         return self
 
     def __next__(self) -> tuple[int, str, dict, dict]:
-        if self.__idx >= len(self):
+        if self.__idx >= self.__total:
             raise StopIteration
 
-        machine_id = self.machine_ids[self.__idx % len(self.machine_ids)]
-        sample_idx = self.__idx // len(self.machine_ids)
-
         sample = (
             self.__idx,
-            machine_id,
-            self.source[machine_id][sample_idx],
-            self.target[machine_id][sample_idx],
+            self.__machine_id_column[self.__idx],
+            self.__source_column[self.__idx],
+            self.__target_column[self.__idx],
         )
 
         self.__idx += 1
@@ -121,7 +152,7 @@ class MappingDataset:
         Args:
             index (int): The index to set.
         """
-        if index < 0 or index >= len(self):
+        if index < 0 or index >= self.__total:
             raise IndexError("Index out of range.")
 
         self.__idx = index
@@ -134,4 +165,4 @@ class MappingDataset:
         Returns:
             bool: True if the current machine is the last one, False otherwise.
         """
-        return self.__idx % len(self.machine_ids) == 0
+        return self.__idx % self.__num_machines == 0
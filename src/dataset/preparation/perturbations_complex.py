@@ -1,9 +1,18 @@
-from datetime import datetime, timedelta
+from collections.abc import Callable
 import random
 
 from src.dataset.preparation.util import convert_units
 
 
+# "THH:MM:SS" suffixes of every minute of a day, to build timestamps by concatenation
+MINUTE_SUFFIXES = tuple(f"T{h:02d}:{m:02d}:00" for h in range(24) for m in range(60))
+
+LOG_METADATA = "IP=192.168.10.77 Facility=Plant-A Floor=2 Section=23/C"
+
+# bound to the shared module RNG, so it still follows `random.seed`
+_randrange = random.randrange
+
+
 def machine_01(target: dict) -> dict:
     """
     ### Machine 01 - Inconsistent Casing & Field Variants
@@ -93,25 +102,25 @@ def machine_03(target: dict) -> dict:
     target = convert_units(target)
     return {
         "CurrentDate": target["date"],
-        "Uptime": f"{target["operation_hours"]} s",
-        "Power": f"{target["energy_consumption_kWh"]} MWh",
-        "SubstanceUsed": f"{target["material_used_kg"]} g",
-        "SubstanceWaste": f"{target["material_waste_kg"]} mg",
-        "CarbonDioxide": f"{target["CO2_emissions_kg"]} t",
-        "WaterUsage": f"{target["water_consumption_liters"]} mL",
-        "WaterReclaimed": f"{target["water_recycled_liters"]} mL",
-        "Yield": f"{target["product_output_units"]} k units",
-        "Temp": f"{target["operating_temperature_C"]} K",
-        "Moisture": f"Fraction: {target["ambient_humidity_percent"]}",
-        "VibLvl": f"{target["vibration_level_mmps"]} mm/min",
-        "RegenerativePower": f"Fraction: {target["renewable_energy_percent"]}",
-        "Idle": f"{target["downtime_minutes"]} s",
-        "Noise": f"{target["noise_level_dB"]} dB",
-        "NumLocalEmployees": f"{target["worker_count"]} employees",
-        "Oiling": f"Level: {target["lubrication_level"]}",
-        "Cooling": f"Status: {target["cooling_system_status"]}",
-        "Service": f"Needed: {target["maintenance_required"]}",
-        "Fuel": f"Type: {target["fuel_type"]}",
+        "Uptime": str(target["operation_hours"]) + " s",
+        "Power": str(target["energy_consumption_kWh"]) + " MWh",
+        "SubstanceUsed": str(target["material_used_kg"]) + " g",
+        "SubstanceWaste": str(target["material_waste_kg"]) + " mg",
+        "CarbonDioxide": str(target["CO2_emissions_kg"]) + " t",
+        "WaterUsage": str(target["water_consumption_liters"]) + " mL",
+        "WaterReclaimed": str(target["water_recycled_liters"]) + " mL",
+        "Yield": str(target["product_output_units"]) + " k units",
+        "Temp": str(target["operating_temperature_C"]) + " K",
+        "Moisture": "Fraction: " + str(target["ambient_humidity_percent"]),
+        "VibLvl": str(target["vibration_level_mmps"]) + " mm/min",
+        "RegenerativePower": "Fraction: " + str(target["renewable_energy_percent"]),
+        "Idle": str(target["downtime_minutes"]) + " s",
+        "Noise": str(target["noise_level_dB"]) + " dB",
+        "NumLocalEmployees": str(target["worker_count"]) + " employees",
+        "Oiling": "Level: " + target["lubrication_level"],
+        "Cooling": "Status: " + target["cooling_system_status"],
+        "Service": "Needed: " + target["maintenance_required"],
+        "Fuel": "Type: " + target["fuel_type"],
     }
 
 
@@ -187,10 +196,10 @@ def machine_06(target: dict) -> dict:
     Data is structured as a JSON log with timestamps and event types.
     The units are not standardized and vary between fields.
     """
-    base_time = datetime.strptime(target["date"], "%Y-%m-%d")
+    date = target["date"]
 
     def make_event(event_type, value, unit=None):
-        timestamp = (base_time + timedelta(minutes=random.randint(0, 1439))).isoformat()
+        timestamp = date + MINUTE_SUFFIXES[_randrange(1440)]
         return {
             "timestamp": timestamp,
             "event_type": event_type,
@@ -233,12 +242,12 @@ def machine_07(target: dict) -> dict:
     Data is structured as a log file with timestamps and additional metadata.
     The units are not standardized and vary between fields.
     """
-    base_time = datetime.strptime(target["date"], "%Y-%m-%d")
+    date = target["date"]
 
     def log_line(event, value, unit=None):
-        timestamp = (base_time + timedelta(minutes=random.randint(0, 1439))).isoformat()
-        msg = f"{event}: {value}{(' ' + unit) if unit else ''}"
-        return f"[{timestamp}] IP=192.168.10.77 Facility=Plant-A Floor=2 Section=23/C :: {msg}"
+        timestamp = date + MINUTE_SUFFIXES[_randrange(1440)]
+        unit = f" {unit}" if unit else ""
+        return f"[{timestamp}] {LOG_METADATA} :: {event}: {value}{unit}"
 
     target = convert_units(target)
 
@@ -267,6 +276,31 @@ def machine_07(target: dict) -> dict:
     return {"machine_log": "\n".join(sorted(log_entries))}
 
 
+# CSV header and target key of every column reported by machine 08
+MACHINE_08_COLUMNS = (
+    ("CurrentDateIso", "date"),
+    ("UptimeSeconds", "operation_hours"),
+    ("PowerMWh", "energy_consumption_kWh"),
+    ("SubstanceUsedGrams", "material_used_kg"),
+    ("SubstanceWasteMilligrams", "material_waste_kg"),
+    ("CarbonDioxideTonnes", "CO2_emissions_kg"),
+    ("WaterUsageMilliliters", "water_consumption_liters"),
+    ("WaterReclaimedMilliliters", "water_recycled_liters"),
+    ("TempK", "operating_temperature_C"),
+    ("MoistureFraction", "ambient_humidity_percent"),
+    ("VibLvlMmpmin", "vibration_level_mmps"),
+    ("RegenerativePowerFraction", "renewable_energy_percent"),
+    ("YieldUnitsThousands", "product_output_units"),
+    ("IdleSeconds", "downtime_minutes"),
+    ("NoiseDb", "noise_level_dB"),
+    ("NumLocalEmployees", "worker_count"),
+    ("Oiling", "lubrication_level"),
+    ("Cooling", "cooling_system_status"),
+    ("Service", "maintenance_required"),
+    ("Fuel", "fuel_type"),
+)
+
+
 def machine_08(target: dict) -> dict:
     """
     ### Machine 08 - Embedded CSV in JSON
@@ -278,35 +312,14 @@ def machine_08(target: dict) -> dict:
     """
     target = convert_units(target)
 
-    fields = [
-        ("CurrentDateIso", target["date"]),
-        ("UptimeSeconds", target["operation_hours"]),
-        ("PowerMWh", target["energy_consumption_kWh"]),
-        ("SubstanceUsedGrams", target["material_used_kg"]),
-        ("SubstanceWasteMilligrams", target["material_waste_kg"]),
-        ("CarbonDioxideTonnes", target["CO2_emissions_kg"]),
-        ("WaterUsageMilliliters", target["water_consumption_liters"]),
-        ("WaterReclaimedMilliliters", target["water_recycled_liters"]),
-        ("TempK", target["operating_temperature_C"]),
-        ("MoistureFraction", target["ambient_humidity_percent"]),
-        ("VibLvlMmpmin", target["vibration_level_mmps"]),
-        ("RegenerativePowerFraction", target["renewable_energy_percent"]),
-        ("YieldUnitsThousands", target["product_output_units"]),
-        ("IdleSeconds", target["downtime_minutes"]),
-        ("NoiseDb", target["noise_level_dB"]),
-        ("NumLocalEmployees", target["worker_count"]),
-        ("Oiling", target["lubrication_level"]),
-        ("Cooling", target["cooling_system_status"]),
-        ("Service", str(target["maintenance_required"])),
-        ("Fuel", target["fuel_type"]),
-    ]
-
-    random.shuffle(fields)  # Non-standardized order
+    columns = list(MACHINE_08_COLUMNS)
+    random.shuffle(columns)  # Non-standardized order
 
-    headers = [f[0] for f in fields]
-    values = [f'"{f[1]}"' for f in fields]
+    headers = ",".join([header for header, _ in columns])
+    # quote all values at once by joining them with the quoted delimiter
+    values = '","'.join([f"{target[key]}" for _, key in columns])
 
-    csv_string = ",".join(headers) + "\n" + ",".join(values)
+    csv_string = f'{headers}\n"{values}"'
 
     return {"data_csv": csv_string}
 
@@ -319,31 +332,26 @@ def machine_09(target: dict) -> dict:
     and redundant computed fields (e.g., output_per_hour, CO2_per_unit).
     """
     total_minutes = 24 * 60
-    availability_percent = 100 * (target["operation_hours"] * 60) / total_minutes
-    output_per_hour = (
-        round(target["product_output_units"] / target["operation_hours"], 2)
-        if target["operation_hours"]
-        else 0
-    )
+    operation_hours = target["operation_hours"]
+    output_units = target["product_output_units"]
+    material_used = target["material_used_kg"]
+    energy_consumption = target["energy_consumption_kWh"]
+
+    availability_percent = 100 * (operation_hours * 60) / total_minutes
+    output_per_hour = round(output_units / operation_hours, 2) if operation_hours else 0
     CO2_per_unit = (
-        round(target["CO2_emissions_kg"] / target["product_output_units"], 4)
-        if target["product_output_units"]
-        else 0
+        round(target["CO2_emissions_kg"] / output_units, 4) if output_units else 0
     )
     material_yield_percent = (
-        round(100 * (target["product_output_units"] / target["material_used_kg"]), 2)
-        if target["material_used_kg"]
-        else 0
+        round(100 * (output_units / material_used), 2) if material_used else 0
     )
     waste_rate_percent = (
-        round(100 * (target["material_waste_kg"] / target["material_used_kg"]), 2)
-        if target["material_used_kg"]
+        round(100 * (target["material_waste_kg"] / material_used), 2)
+        if material_used
         else 0
     )
     energy_efficiency = (
-        round(target["product_output_units"] / target["energy_consumption_kWh"], 3)
-        if target["energy_consumption_kWh"]
-        else 0
+        round(output_units / energy_consumption, 3) if energy_consumption else 0
     )
 
     return {
@@ -409,7 +417,7 @@ def machine_10(target: dict) -> dict:
     return {"operator_summary": summary}
 
 
-PERTURBATION_FUNCTIONS = [
+PERTURBATION_FUNCTIONS: tuple[Callable[[dict], dict], ...] = (
     machine_01,
     machine_02,
     machine_03,
@@ -420,4 +428,8 @@ PERTURBATION_FUNCTIONS = [
     machine_08,
     machine_09,
     machine_10,
-]
+)
+
+PERTURBATION_BY_NAME: dict[str, Callable[[dict], dict]] = {
+    fn.__name__: fn for fn in PERTURBATION_FUNCTIONS
+}
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from src.dataset.preparation.util import convert_units
 
 
@@ -64,25 +66,25 @@ def machine_03(target: dict) -> dict:
     """
     return {
         "CurrentDate": target["date"],
-        "Uptime": f"{target["operation_hours"]} h",
-        "Power": f"{target["energy_consumption_kWh"]} kWh",
-        "SubstanceUsed": f"{target["material_used_kg"]} kg",
-        "SubstanceWaste": f"{target["material_waste_kg"]} kg",
-        "CarbonDioxide": f"{target["CO2_emissions_kg"]} kg",
-        "WaterUsage": f"{target["water_consumption_liters"]} L",
-        "WaterReclaimed": f"{target["water_recycled_liters"]} L",
-        "Yield": f"{target["product_output_units"]} units",
-        "Temp": f"{target["operating_temperature_C"]} °C",
-        "Moisture": f"{target["ambient_humidity_percent"]} %",
-        "VibLvl": f"{target["vibration_level_mmps"]} mm/s",
-        "RegenerativePower": f"{target["renewable_energy_percent"]} %",
-        "Idle": f"{target["downtime_minutes"]} min",
-        "Noise": f"{target["noise_level_dB"]} dB",
-        "NumLocalEmployees": f"{target["worker_count"]} workers",
-        "Oiling": f"Level: {target["lubrication_level"]}",
-        "Cooling": f"Status: {target["cooling_system_status"]}",
-        "Service": f"Needed: {target["maintenance_required"]}",
-        "Fuel": f"Category: {target["fuel_type"]}",
+        "Uptime": str(target["operation_hours"]) + " h",
+        "Power": str(target["energy_consumption_kWh"]) + " kWh",
+        "SubstanceUsed": str(target["material_used_kg"]) + " kg",
+        "SubstanceWaste": str(target["material_waste_kg"]) + " kg",
+        "CarbonDioxide": str(target["CO2_emissions_kg"]) + " kg",
+        "WaterUsage": str(target["water_consumption_liters"]) + " L",
+        "WaterReclaimed": str(target["water_recycled_liters"]) + " L",
+        "Yield": str(target["product_output_units"]) + " units",
+        "Temp": str(target["operating_temperature_C"]) + " °C",
+        "Moisture": str(target["ambient_humidity_percent"]) + " %",
+        "VibLvl": str(target["vibration_level_mmps"]) + " mm/s",
+        "RegenerativePower": str(target["renewable_energy_percent"]) + " %",
+        "Idle": str(target["downtime_minutes"]) + " min",
+        "Noise": str(target["noise_level_dB"]) + " dB",
+        "NumLocalEmployees": str(target["worker_count"]) + " workers",
+        "Oiling": "Level: " + str(target["lubrication_level"]),
+        "Cooling": "Status: " + str(target["cooling_system_status"]),
+        "Service": "Needed: " + str(target["maintenance_required"]),
+        "Fuel": "Category: " + str(target["fuel_type"]),
     }
 
 
@@ -93,25 +95,25 @@ def machine_04(target: dict) -> dict:
     target = convert_units(target)
     return {
         "CurrentDate": target["date"],
-        "Uptime": f"{target["operation_hours"]} s",
-        "Power": f"{target["energy_consumption_kWh"]} MWh",
-        "SubstanceUsed": f"{target["material_used_kg"]} g",
-        "SubstanceWaste": f"{target["material_waste_kg"]} mg",
-        "CarbonDioxide": f"{target["CO2_emissions_kg"]} t",
-        "WaterUsage": f"{target["water_consumption_liters"]} mL",
-        "WaterReclaimed": f"{target["water_recycled_liters"]} mL",
-        "Yield": f"{target["product_output_units"]} k units",
-        "Temp": f"{target["operating_temperature_C"]} K",
-        "Moisture": f"Fraction: {target["ambient_humidity_percent"]}",
-        "VibLvl": f"{target["vibration_level_mmps"]} mm/min",
-        "RegenerativePower": f"Fraction: {target["renewable_energy_percent"]}",
-        "Idle": f"{target["downtime_minutes"]} s",
-        "Noise": f"{target["noise_level_dB"]} dB",
-        "NumLocalEmployees": f"{target["worker_count"]} employees",
-        "Oiling": f"Level: {target["lubrication_level"]}",
-        "Cooling": f"Status: {target["cooling_system_status"]}",
-        "Service": f"Needed: {target["maintenance_required"]}",
-        "Fuel": f"Type: {target["fuel_type"]}",
+        "Uptime": str(target["operation_hours"]) + " s",
+        "Power": str(target["energy_consumption_kWh"]) + " MWh",
+        "SubstanceUsed": str(target["material_used_kg"]) + " g",
+        "SubstanceWaste": str(target["material_waste_kg"]) + " mg",
+        "CarbonDioxide": str(target["CO2_emissions_kg"]) + " t",
+        "WaterUsage": str(target["water_consumption_liters"]) + " mL",
+        "WaterReclaimed": str(target["water_recycled_liters"]) + " mL",
+        "Yield": str(target["product_output_units"]) + " k units",
+        "Temp": str(target["operating_temperature_C"]) + " K",
+        "Moisture": "Fraction: " + str(target["ambient_humidity_percent"]),
+        "VibLvl": str(target["vibration_level_mmps"]) + " mm/min",
+        "RegenerativePower": "Fraction: " + str(target["renewable_energy_percent"]),
+        "Idle": str(target["downtime_minutes"]) + " s",
+        "Noise": str(target["noise_level_dB"]) + " dB",
+        "NumLocalEmployees": str(target["worker_count"]) + " employees",
+        "Oiling": "Level: " + str(target["lubrication_level"]),
+        "Cooling": "Status: " + str(target["cooling_system_status"]),
+        "Service": "Needed: " + str(target["maintenance_required"]),
+        "Fuel": "Type: " + str(target["fuel_type"]),
     }
 
 
@@ -151,25 +153,25 @@ def machine_06(target: dict) -> dict:
     target = convert_units(target)
     return {
         "date": target["date"],
-        "operation": f"{target["operation_hours"]} s",
-        "energy_consumption": f"{target["energy_consumption_kWh"]} MWh",
-        "material_used": f"{target["material_used_kg"]} g",
-        "material_waste": f"{target["material_waste_kg"]} mg",
-        "CO2_emissions": f"{target["CO2_emissions_kg"]} t",
-        "water_consumption": f"{target["water_consumption_liters"]} mL",
-        "water_recycled": f"{target["water_recycled_liters"]} mL",
-        "product_output": f"{target["product_output_units"]} k units",
-        "operating_temperature": f"{target["operating_temperature_C"]} K",
-        "ambient_humidity": f"Fraction: {target["ambient_humidity_percent"]}",
-        "vibration_level": f"{target["vibration_level_mmps"]} mm/min",
-        "renewable_energy": f"Fraction: {target["renewable_energy_percent"]}",
-        "donwtime": f"{target["downtime_minutes"]} s",
-        "noise_level": f"{target["noise_level_dB"]} dB",
-        "worker_count": f"{target["worker_count"]} employees",
-        "lubrication": f"Level: {target["lubrication_level"]}",
-        "cooling_system": f"Status: {target["cooling_system_status"]}",
-        "maintenance": f"Needed: {target["maintenance_required"]}",
-        "fuel": f"Type: {target["fuel_type"]}",
+        "operation": str(target["operation_hours"]) + " s",
+        "energy_consumption": str(target["energy_consumption_kWh"]) + " MWh",
+        "material_used": str(target["material_used_kg"]) + " g",
+        "material_waste": str(target["material_waste_kg"]) + " mg",
+        "CO2_emissions": str(target["CO2_emissions_kg"]) + " t",
+        "water_consumption": str(target["water_consumption_liters"]) + " mL",
+        "water_recycled": str(target["water_recycled_liters"]) + " mL",
+        "product_output": str(target["product_output_units"]) + " k units",
+        "operating_temperature": str(target["operating_temperature_C"]) + " K",
+        "ambient_humidity": "Fraction: " + str(target["ambient_humidity_percent"]),
+        "vibration_level": str(target["vibration_level_mmps"]) + " mm/min",
+        "renewable_energy": "Fraction: " + str(target["renewable_energy_percent"]),
+        "donwtime": str(target["downtime_minutes"]) + " s",
+        "noise_level": str(target["noise_level_dB"]) + " dB",
+        "worker_count": str(target["worker_count"]) + " employees",
+        "lubrication": "Level: " + str(target["lubrication_level"]),
+        "cooling_system": "Status: " + str(target["cooling_system_status"]),
+        "maintenance": "Needed: " + str(target["maintenance_required"]),
+        "fuel": "Type: " + str(target["fuel_type"]),
     }
 
 
@@ -179,25 +181,25 @@ def machine_07(target: dict) -> dict:
     """
     return {
         "date": target["date"],
-        "operation": f"{target["operation_hours"]} h",
-        "energy_consumption": f"{target["energy_consumption_kWh"]} kWh",
-        "material_used": f"{target["material_used_kg"]} kg",
-        "material_waste": f"{target["material_waste_kg"]} kg",
-        "CO2_emissions": f"{target["CO2_emissions_kg"]} kg",
-        "water_consumption": f"{target["water_consumption_liters"]} L",
-        "water_recycled": f"{target["water_recycled_liters"]} L",
-        "product_output": f"{target["product_output_units"]} units",
-        "operating_temperature": f"{target["operating_temperature_C"]} °C",
-        "ambient_humidity": f"{target["ambient_humidity_percent"]} %",
-        "vibration_level": f"{target["vibration_level_mmps"]} mm/s",
-        "renewable_energy": f"{target["renewable_energy_percent"]} %",
-        "downtime": f"{target["downtime_minutes"]} min",
-        "noise_level": f"{target["noise_level_dB"]} dB",
-        "worker_count": f"{target["worker_count"]} workers",
-        "lubrication": f"Level: {target["lubrication_level"]}",
-        "cooling_system": f"Status: {target["cooling_system_status"]}",
-        "maintenance": f"Needed: {target["maintenance_required"]}",
-        "fuel": f"Type: {target["fuel_type"]}",
+        "operation": str(target["operation_hours"]) + " h",
+        "energy_consumption": str(target["energy_consumption_kWh"]) + " kWh",
+        "material_used": str(target["material_used_kg"]) + " kg",
+        "material_waste": str(target["material_waste_kg"]) + " kg",
+        "CO2_emissions": str(target["CO2_emissions_kg"]) + " kg",
+        "water_consumption": str(target["water_consumption_liters"]) + " L",
+        "water_recycled": str(target["water_recycled_liters"]) + " L",
+        "product_output": str(target["product_output_units"]) + " units",
+        "operating_temperature": str(target["operating_temperature_C"]) + " °C",
+        "ambient_humidity": str(target["ambient_humidity_percent"]) + " %",
+        "vibration_level": str(target["vibration_level_mmps"]) + " mm/s",
+        "renewable_energy": str(target["renewable_energy_percent"]) + " %",
+        "downtime": str(target["downtime_minutes"]) + " min",
+        "noise_level": str(target["noise_level_dB"]) + " dB",
+        "worker_count": str(target["worker_count"]) + " workers",
+        "lubrication": "Level: " + str(target["lubrication_level"]),
+        "cooling_system": "Status: " + str(target["cooling_system_status"]),
+        "maintenance": "Needed: " + str(target["maintenance_required"]),
+        "fuel": "Type: " + str(target["fuel_type"]),
     }
 
 
@@ -205,7 +207,7 @@ def machine_08(target: dict) -> dict:
     """
     ### Machine 08 - Same Key | Correct Unit | Unit in Key (IDENTITY MAPPING)
     """
-    return {**target}
+    return target.copy()
 
 
 def machine_09(target: dict) -> dict:
@@ -385,7 +387,7 @@ def machine_10(target: dict) -> dict:
     }
 
 
-PERTURBATION_FUNCTIONS = [
+PERTURBATION_FUNCTIONS: tuple[Callable[[dict], dict], ...] = (
     machine_01,
     machine_02,
     machine_03,
@@ -396,4 +398,8 @@ PERTURBATION_FUNCTIONS = [
     machine_08,
     machine_09,
     machine_10,
-]
+)
+
+PERTURBATION_BY_NAME: dict[str, Callable[[dict], dict]] = {
+    fn.__name__: fn for fn in PERTURBATION_FUNCTIONS
+}
@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from src.dataset.preparation.util import convert_units_simple
 
 
@@ -42,14 +44,14 @@ def machine_03(target: dict) -> dict:
     """
     return {
         "CurrentDate": target["date"],
-        "Uptime": f"{target["operation_hours"]} h",
-        "Power": f"{target["energy_consumption_kWh"]} kWh",
-        "SubstanceUsed": f"{target["material_used_kg"]} kg",
-        "SubstanceWaste": f"{target["material_waste_kg"]} kg",
-        "CarbonDioxide": f"{target["CO2_emissions_kg"]} kg",
-        "WaterUsage": f"{target["water_consumption_liters"]} L",
-        "WaterReclaimed": f"{target["water_recycled_liters"]} L",
-        "Yield": f"{target["product_output_units"]} units",
+        "Uptime": str(target["operation_hours"]) + " h",
+        "Power": str(target["energy_consumption_kWh"]) + " kWh",
+        "SubstanceUsed": str(target["material_used_kg"]) + " kg",
+        "SubstanceWaste": str(target["material_waste_kg"]) + " kg",
+        "CarbonDioxide": str(target["CO2_emissions_kg"]) + " kg",
+        "WaterUsage": str(target["water_consumption_liters"]) + " L",
+        "WaterReclaimed": str(target["water_recycled_liters"]) + " L",
+        "Yield": str(target["product_output_units"]) + " units",
     }
 
 
@@ -60,14 +62,14 @@ def machine_04(target: dict) -> dict:
     target = convert_units_simple(target)
     return {
         "CurrentDate": target["date"],
-        "Uptime": f"{target["operation_hours"]} s",
-        "Power": f"{target["energy_consumption_kWh"]} MWh",
-        "SubstanceUsed": f"{target["material_used_kg"]} g",
-        "SubstanceWaste": f"{target["material_waste_kg"]} mg",
-        "CarbonDioxide": f"{target["CO2_emissions_kg"]} t",
-        "WaterUsage": f"{target["water_consumption_liters"]} mL",
-        "WaterReclaimed": f"{target["water_recycled_liters"]} mL",
-        "Yield": f"{target["product_output_units"]} k units",
+        "Uptime": str(target["operation_hours"]) + " s",
+        "Power": str(target["energy_consumption_kWh"]) + " MWh",
+        "SubstanceUsed": str(target["material_used_kg"]) + " g",
+        "SubstanceWaste": str(target["material_waste_kg"]) + " mg",
+        "CarbonDioxide": str(target["CO2_emissions_kg"]) + " t",
+        "WaterUsage": str(target["water_consumption_liters"]) + " mL",
+        "WaterReclaimed": str(target["water_recycled_liters"]) + " mL",
+        "Yield": str(target["product_output_units"]) + " k units",
     }
 
 
@@ -96,14 +98,14 @@ def machine_06(target: dict) -> dict:
     target = convert_units_simple(target)
     return {
         "date": target["date"],
-        "operation": f"{target["operation_hours"]} s",
-        "energy_consumption": f"{target["energy_consumption_kWh"]} MWh",
-        "material_used": f"{target["material_used_kg"]} g",
-        "material_waste": f"{target["material_waste_kg"]} mg",
-        "CO2_emissions": f"{target["CO2_emissions_kg"]} t",
-        "water_consumption": f"{target["water_consumption_liters"]} mL",
-        "water_recycled": f"{target["water_recycled_liters"]} mL",
-        "product_output": f"{target["product_output_units"]} k units",
+        "operation": str(target["operation_hours"]) + " s",
+        "energy_consumption": str(target["energy_consumption_kWh"]) + " MWh",
+        "material_used": str(target["material_used_kg"]) + " g",
+        "material_waste": str(target["material_waste_kg"]) + " mg",
+        "CO2_emissions": str(target["CO2_emissions_kg"]) + " t",
+        "water_consumption": str(target["water_consumption_liters"]) + " mL",
+        "water_recycled": str(target["water_recycled_liters"]) + " mL",
+        "product_output": str(target["product_output_units"]) + " k units",
     }
 
 
@@ -113,14 +115,14 @@ def machine_07(target: dict) -> dict:
     """
     return {
         "date": target["date"],
-        "operation": f"{target["operation_hours"]} h",
-        "energy_consumption": f"{target["energy_consumption_kWh"]} kWh",
-        "material_used": f"{target["material_used_kg"]} kg",
-        "material_waste": f"{target["material_waste_kg"]} kg",
-        "CO2_emissions": f"{target["CO2_emissions_kg"]} kg",
-        "water_consumption": f"{target["water_consumption_liters"]} L",
-        "water_recycled": f"{target["water_recycled_liters"]} L",
-        "product_output": f"{target["product_output_units"]} units",
+        "operation": str(target["operation_hours"]) + " h",
+        "energy_consumption": str(target["energy_consumption_kWh"]) + " kWh",
+        "material_used": str(target["material_used_kg"]) + " kg",
+        "material_waste": str(target["material_waste_kg"]) + " kg",
+        "CO2_emissions": str(target["CO2_emissions_kg"]) + " kg",
+        "water_consumption": str(target["water_consumption_liters"]) + " L",
+        "water_recycled": str(target["water_recycled_liters"]) + " L",
+        "product_output": str(target["product_output_units"]) + " units",
     }
 
 
@@ -128,7 +130,7 @@ def machine_08(target: dict) -> dict:
     """
     ### Machine 08 - Same Key | Correct Unit | Unit in Key (IDENTITY MAPPING)
     """
-    return {**target}
+    return target.copy()
 
 
 def machine_09(target: dict) -> dict:
@@ -220,7 +222,7 @@ def machine_10(target: dict) -> dict:
     }
 
 
-PERTURBATION_FUNCTIONS = [
+PERTURBATION_FUNCTIONS: tuple[Callable[[dict], dict], ...] = (
     machine_01,
     machine_02,
     machine_03,
@@ -231,4 +233,8 @@ PERTURBATION_FUNCTIONS = [
     machine_08,
     machine_09,
     machine_10,
-]
+)
+
+PERTURBATION_BY_NAME: dict[str, Callable[[dict], dict]] = {
+    fn.__name__: fn for fn in PERTURBATION_FUNCTIONS
+}
@@ -11,37 +11,51 @@ from src.dataset.preparation import (
 from src.types import Difficulty
 
 
-BASE_TARGET_SIMPLE = {
+# (low, high, ndigits) of the uniformly sampled numeric values,
+# ndigits None rounds to an integer
+NUMERIC_FIELDS_SIMPLE = {
     # float values
-    "operation_hours": lambda: round(np.random.uniform(7, 10), 2),
-    "energy_consumption_kWh": lambda: round(np.random.uniform(300, 500), 2),
-    "material_used_kg": lambda: round(np.random.uniform(400, 700), 2),
-    "material_waste_kg": lambda: round(np.random.uniform(30, 50), 2),
-    "CO2_emissions_kg": lambda: round(np.random.uniform(200, 400), 2),
-    "water_consumption_liters": lambda: round(np.random.uniform(800, 1200), 2),
-    "water_recycled_liters": lambda: round(np.random.uniform(400, 800), 2),
+    "operation_hours": (7, 10, 2),
+    "energy_consumption_kWh": (300, 500, 2),
+    "material_used_kg": (400, 700, 2),
+    "material_waste_kg": (30, 50, 2),
+    "CO2_emissions_kg": (200, 400, 2),
+    "water_consumption_liters": (800, 1200, 2),
+    "water_recycled_liters": (400, 800, 2),
     # integer values
-    "product_output_units": lambda: round(np.random.uniform(200, 400)),
+    "product_output_units": (200, 400, None),
 }
 
-BASE_TARGET = {
-    **BASE_TARGET_SIMPLE,
+NUMERIC_FIELDS = {
+    **NUMERIC_FIELDS_SIMPLE,
     # float values
-    "operating_temperature_C": lambda: round(np.random.uniform(70, 80), 2),
-    "ambient_humidity_percent": lambda: round(np.random.uniform(45, 55), 2),
-    "vibration_level_mmps": lambda: round(np.random.uniform(1, 3), 2),
-    "renewable_energy_percent": lambda: round(np.random.uniform(40, 60), 2),
+    "operating_temperature_C": (70, 80, 2),
+    "ambient_humidity_percent": (45, 55, 2),
+    "vibration_level_mmps": (1, 3, 2),
+    "renewable_energy_percent": (40, 60, 2),
     # integer values
-    "downtime_minutes": lambda: round(np.random.uniform(5, 40)),
-    "noise_level_dB": lambda: round(np.random.uniform(70, 90)),
-    "worker_count": lambda: round(np.random.uniform(1, 4)),
-    # categorical values
-    "lubrication_level": lambda: random.choice(["low", "moderate", "high"]),
-    "cooling_system_status": lambda: random.choice(["operational", "faulty", "off"]),
-    "maintenance_required": lambda: random.choice([True, False]),
-    "fuel_type": lambda: random.choice(
-        ["electric", "fossil_fuel", "renewable_fuel", "hybrid"]
-    ),
+    "downtime_minutes": (5, 40, None),
+    "noise_level_dB": (70, 90, None),
+    "worker_count": (1, 4, None),
+}
+
+CATEGORICAL_FIELDS = {
+    "lubrication_level": ["low", "moderate", "high"],
+    "cooling_system_status": ["operational", "faulty", "off"],
+    "maintenance_required": [True, False],
+    "fuel_type": ["electric", "fossil_fuel", "renewable_fuel", "hybrid"],
+}
+
+
+def _numeric_sampler(fields: dict) -> tuple:
+    """Splits numeric field specs into keys, bound arrays and rounding digits."""
+    lows, highs, ndigits = zip(*fields.values())
+    return tuple(fields), np.array(lows), np.array(highs), ndigits
+
+
+NUMERIC_SAMPLERS = {
+    "simple": _numeric_sampler(NUMERIC_FIELDS_SIMPLE),
+    "default": _numeric_sampler(NUMERIC_FIELDS),
 }
 
 
@@ -52,6 +66,35 @@ PERTURBATION_FUNCTIONS = {
 }
 
 
+def _build_target_sample(
+    date: str, values: list[float], difficulty: Difficulty
+) -> dict:
+    """Builds a target sample from pre-drawn numeric values and draws its categorical
+    values.
+
+    Args:
+        date (str): The date of the sample in "YYYY-MM-DD" format.
+        values (list[float]): The unrounded numeric values in field order.
+        difficulty (Difficulty): The difficulty level of the sample.
+
+    Returns:
+        dict: A dictionary containing the generated sample.
+    """
+    simple = difficulty == "simple"
+    keys, _, _, ndigits = NUMERIC_SAMPLERS["simple" if simple else "default"]
+
+    sample = {
+        "date": date,
+        **{key: round(v, n) for key, v, n in zip(keys, values, ndigits)},
+    }
+
+    if not simple:
+        for key, options in CATEGORICAL_FIELDS.items():
+            sample[key] = random.choice(options)
+
+    return sample
+
+
 def generate_target_sample(date: datetime, difficulty: Difficulty) -> dict:
     """Generates a target sample for a given date.
 
@@ -62,12 +105,14 @@ def generate_target_sample(date: datetime, difficulty: Difficulty) -> dict:
     Returns:
         dict: A dictionary containing the generated sample.
     """
-    base_target = BASE_TARGET_SIMPLE if difficulty == "simple" else BASE_TARGET
+    sampler = NUMERIC_SAMPLERS["simple" if difficulty == "simple" else "default"]
+    _, lows, highs, _ = sampler
 
-    return {
-        "date": date.strftime("%Y-%m-%d"),
-        **{key: base_target[key]() for key in base_target.keys()},
-    }
+    # one draw for all numeric fields consumes the seeded stream in field order,
+    # exactly like one scalar draw per field
+    values = np.random.uniform(lows, highs).tolist()
+
+    return _build_target_sample(date.date().isoformat(), values, difficulty)
 
 
 def all_days_datetime(year: int):
@@ -105,18 +150,27 @@ def generate_dataset(difficulty: Difficulty) -> tuple[dict, dict]:
     source_dataset = {}
 
     pf = PERTURBATION_FUNCTIONS[difficulty]
+    dates = [day.date().isoformat() for day in all_days_datetime(2024)]
+
+    # The numeric values are the only numpy draws, so drawing all of them at once
+    # (in C order: machine, day, field) yields the same values as drawing them per
+    # sample. The categorical and perturbation draws share the `random` stream and
+    # stay interleaved per sample.
+    sampler = NUMERIC_SAMPLERS["simple" if difficulty == "simple" else "default"]
+    _, lows, highs, _ = sampler
+    numeric_values = np.random.uniform(lows, highs, size=(10, len(dates), len(lows)))
+    numeric_values = numeric_values.tolist()
 
     for machine_index in range(10):
         machine_id = f"M{machine_index + 1:03}"
-        target_dataset[machine_id] = []
-        source_dataset[machine_id] = []
-
-        for day in all_days_datetime(2024):
-            target_sample = generate_target_sample(day, difficulty)
-            target_dataset[machine_id].append(target_sample)
-
-            source_sample = pf[machine_index](target_sample)
-            source_dataset[machine_id].append(source_sample)
+        target_dataset[machine_id] = targets = []
+        source_dataset[machine_id] = sources = []
+        perturb = pf[machine_index]
+
+        for date, values in zip(dates, numeric_values[machine_index]):
+            target_sample = _build_target_sample(date, values, difficulty)
+            targets.append(target_sample)
+            sources.append(perturb(target_sample))
 
     return source_dataset, target_dataset
 
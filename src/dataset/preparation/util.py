@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import lru_cache
 
 
 h_to_s = lambda h: round(h * 3600, 2)
@@ -23,7 +24,17 @@ pct_to_frac = lambda pct: round(pct / 100, 4)
 
 mmps_to_mmpmin = lambda mmps: round(mmps * 60, 2)
 
-date_to_iso = lambda date: datetime.strptime(date, "%Y-%m-%d").isoformat()
+
+@lru_cache(maxsize=1024)
+def parse_date(date: str) -> datetime:
+    """Parses a "YYYY-MM-DD" date once, as every sample of a day shares the same date."""
+    return datetime.strptime(date, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=1024)
+def date_to_iso(date: str) -> str:
+    return parse_date(date).isoformat()
+
 
 categorical = {
     "low": "reduced",
@@ -56,17 +67,21 @@ def convert_units_simple(sample: dict) -> dict:
 
 
 def convert_units(sample: dict) -> dict:
-    return {
-        **convert_units_simple(sample),
-        "operating_temperature_C": c_to_k(sample["operating_temperature_C"]),
-        "ambient_humidity_percent": pct_to_frac(sample["ambient_humidity_percent"]),
-        "vibration_level_mmps": mmps_to_mmpmin(sample["vibration_level_mmps"]),
-        "renewable_energy_percent": pct_to_frac(sample["renewable_energy_percent"]),
-        "downtime_minutes": min_to_s(sample["downtime_minutes"]),
-        "noise_level_dB": sample["noise_level_dB"],
-        "worker_count": sample["worker_count"],
-        "lubrication_level": categorical[sample["lubrication_level"]],
-        "cooling_system_status": categorical[sample["cooling_system_status"]],
-        "maintenance_required": categorical[sample["maintenance_required"]],
-        "fuel_type": categorical[sample["fuel_type"]],
-    }
+    # extend the simple conversion in place instead of copying it into a new dict
+    converted = convert_units_simple(sample)
+    converted.update(
+        {
+            "operating_temperature_C": c_to_k(sample["operating_temperature_C"]),
+            "ambient_humidity_percent": pct_to_frac(sample["ambient_humidity_percent"]),
+            "vibration_level_mmps": mmps_to_mmpmin(sample["vibration_level_mmps"]),
+            "renewable_energy_percent": pct_to_frac(sample["renewable_energy_percent"]),
+            "downtime_minutes": min_to_s(sample["downtime_minutes"]),
+            "noise_level_dB": sample["noise_level_dB"],
+            "worker_count": sample["worker_count"],
+            "lubrication_level": categorical[sample["lubrication_level"]],
+            "cooling_system_status": categorical[sample["cooling_system_status"]],
+            "maintenance_required": categorical[sample["maintenance_required"]],
+            "fuel_type": categorical[sample["fuel_type"]],
+        }
+    )
+    return converted
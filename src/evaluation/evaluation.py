@@ -68,19 +68,10 @@ def evaluate_direct_mapping(run_dir: str):
             "false_positive": [],
         }
 
-        # Read the jsonl file and convert it to json
+        # Read the jsonl file, it is kept as is so that reruns need no conversion
         input_file_path = os.path.join(raw_results_dir, file_name)
         with open(input_file_path, "r") as f:
-            lines = f.readlines()
-
-        results = [json.loads(line) for line in lines]
-        del lines
-
-        output_file_path = os.path.join(raw_results_dir, f"{machine_id}.json")
-        with open(output_file_path, "w") as f:
-            json.dump(results, f, indent=4)
-
-        os.remove(input_file_path)
+            results = [json.loads(line) for line in f]
 
         # Accumulate the machine stats
         stats = DirectMappingStats()
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import cache
 
 from langchain.prompts import (
     ChatPromptTemplate,
@@ -19,15 +20,17 @@ EXAMPLE_PROMPT = ChatPromptTemplate.from_messages(
 )
 
 
+@cache
 def get_few_shot_examples(difficulty: Difficulty, cache_dir: str):
     """Generates or loads few-shot examples for the specified difficulty level.
+    The serialized examples are cached, so they are only built once per process.
 
     Args:
         difficulty (Difficulty): The difficulty level of the examples.
         cache_dir (str): The directory where the few-shot examples are stored.
 
     Returns:
-        list[dict]: A list of few-shot examples.
+        tuple[dict]: A tuple of few-shot examples.
     """
     file_path = os.path.join(cache_dir, difficulty, f"few_shot_examples.json")
 
@@ -41,13 +44,13 @@ def get_few_shot_examples(difficulty: Difficulty, cache_dir: str):
         with open(file_path, "r") as f:
             examples = json.load(f)
 
-    examples = [
+    examples = tuple(
         {
             "input": json.dumps(example["input"]),
             "output": json.dumps(example["output"]),
         }
         for example in examples
-    ]
+    )
 
     return examples
 
@@ -103,10 +106,14 @@ def get_few_shot_prompt(
     """
     examples = get_few_shot_examples(difficulty, cache_dir)
     few_shot_prompt = FewShotChatMessagePromptTemplate(
-        examples=examples,
+        examples=list(examples),
         example_prompt=EXAMPLE_PROMPT,
     )
 
+    # The examples are constant, so they are rendered to static messages once
+    # instead of being formatted again on every invocation of the prompt.
+    few_shot_messages = few_shot_prompt.format_messages()
+
     system_prompt = SYSTEM_PROMPT
 
     if difficulty != "simple" and include_enums:
@@ -118,7 +125,7 @@ def get_few_shot_prompt(
     prompt_template = ChatPromptTemplate.from_messages(
         [
             SystemMessagePromptTemplate.from_template(system_prompt),
-            few_shot_prompt,
+            *few_shot_messages,
             HUMAN_PROMPT,
         ]
     )
@@ -1,7 +1,11 @@
+from functools import cache
+
 from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
 from langchain.output_parsers import PydanticOutputParser
+from pydantic import BaseModel
 
 from src.llm_mapping.prompts.base_prompt import HUMAN_PROMPT
+from src.llm_mapping.target_model import get_format_instructions
 
 
 SYSTEM_PROMPT = """\
@@ -22,6 +26,16 @@ Provide only the function definition inside a markdown python code block and wit
 """
 
 
+@cache
+def get_function_format_instructions(pydantic_model: type[BaseModel]) -> str:
+    """Returns the format instructions for the mapping function output, computed once per model."""
+    format_instructions = get_format_instructions(pydantic_model)
+    return format_instructions.replace(
+        "The output should be formatted as a JSON instance that conforms to the JSON schema below.",
+        "The function output dict should conform to the JSON schema below.",
+    ).strip()
+
+
 def get_mapping_function_prompt(parser: PydanticOutputParser):
     """Loads or generates a mapping function prompt for the specified difficulty level.
 
@@ -38,10 +52,5 @@ def get_mapping_function_prompt(parser: PydanticOutputParser):
         ]
     )
 
-    format_instructions = parser.get_format_instructions()
-    format_instructions = format_instructions.replace(
-        "The output should be formatted as a JSON instance that conforms to the JSON schema below.",
-        "The function output dict should conform to the JSON schema below.",
-    ).strip()
-
+    format_instructions = get_function_format_instructions(parser.pydantic_object)
     return prompt_template.partial(format_instructions=format_instructions)
@@ -2,6 +2,7 @@ from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
 from langchain.output_parsers import PydanticOutputParser
 
 from src.llm_mapping.prompts.base_prompt import SYSTEM_PROMPT, HUMAN_PROMPT
+from src.llm_mapping.target_model import get_format_instructions
 
 
 def get_zero_shot_prompt(parser: PydanticOutputParser, include_schema: bool):
@@ -26,5 +27,5 @@ def get_zero_shot_prompt(parser: PydanticOutputParser, include_schema: bool):
         ]
     )
 
-    format_instructions = parser.get_format_instructions()
+    format_instructions = get_format_instructions(parser.pydantic_object)
     return prompt_template.partial(format_instructions=format_instructions)
@@ -1,12 +1,15 @@
 from enum import Enum
+from functools import cache
 
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, create_model
 from langchain.output_parsers import PydanticOutputParser
 
 from src.types import Difficulty
 
 
 class TargetModelSimple(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     date: str = Field(
         description="Date of the observation. Format: YYYY-MM-DD", strict=True
     )
@@ -90,6 +93,13 @@ OUTPUT_PARSERS: dict[Difficulty, PydanticOutputParser] = {
 }
 
 
+@cache
+def get_format_instructions(pydantic_model: type[BaseModel]) -> str:
+    """Returns the format instructions for a Pydantic model, computed once per model."""
+    parser = PydanticOutputParser(pydantic_object=pydantic_model)
+    return parser.get_format_instructions()
+
+
 def wrap_thinking_model(pydantic_model: type[BaseModel]) -> type[BaseModel]:
     """Wraps a Pydantic model with a thinking field."""
     return create_model("ThinkingResponse", thinking=str, response=pydantic_model)
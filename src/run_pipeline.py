@@ -120,20 +120,64 @@ class RunPipeline:
         with open(index_file_path, "w") as f:
             f.write(str(index))
 
-    def __push_to_blockchain(self, machine_id: str, data: dict) -> tuple[str, int]:
-        """Push the parsed data to the blockchain.
+    def __save_result(self, index: int, machine_id: str, result: dict):
+        """Append the result of a sample to the raw results and save its index.
 
         Args:
+            index (int): The dataset index of the sample.
             machine_id (str): The ID of the machine.
-            data (dict): The parsed data to be pushed.
+            result (dict): The result of the sample.
+        """
+        file_path = os.path.join(self.raw_results_dir, f"{machine_id}.jsonl")
+        with open(file_path, "a") as f:
+            f.write(json.dumps(result) + "\n")
 
-        Returns:
-            tuple[str, int]: A tuple containing the transaction ID and height.
+        self.__save_last_index(index)
+
+    def __push_to_blockchain(self, day_results: list[tuple[int, str, dict]]):
+        """Push the parsed data of all samples of a day to the blockchain and save the
+        results afterwards.
+
+        The transactions of all machines are broadcast concurrently and confirmed
+        together, so the blockchain time of the day is split evenly across the
+        pushed samples.
+
+        Args:
+            day_results (list[tuple[int, str, dict]]): The index, machine ID and
+                result of each sample of the day.
         """
-        tx_id = self.waves_connector.call_store_metrics(machine_id, data)
-        tx_info = self.waves_connector.wait_for_transaction(tx_id)
+        payloads = {
+            machine_id: result["llm_mapping"]["response_parsed"]
+            for _, machine_id, result in day_results
+            if result["llm_mapping"].get("response_parsed") is not None
+        }
+
+        if payloads:
+            logger.info(f"Pushing {len(payloads)} samples to blockchain")
+            blockchain_time_start = time.time()
+
+            tx_ids = self.waves_connector.call_store_metrics_batch(payloads)
+            tx_infos = self.waves_connector.wait_for_transactions(list(tx_ids.values()))
+
+            blockchain_time = (time.time() - blockchain_time_start) / len(payloads)
+
+        total_samples = len(self.dataset)
+
+        for index, machine_id, result in day_results:
+            if machine_id in payloads:
+                tx_id = tx_ids[machine_id]
+                tx_info = tx_infos[tx_id]
+                if tx_info is None:
+                    raise RuntimeError(f"Transaction {tx_id} was not confirmed.")
 
-        return tx_id, tx_info["height"]
+                result["blockchain_time"] = blockchain_time
+                result["total_time"] += blockchain_time
+
+                prefix = f"[{index + 1:03}/{total_samples}: {machine_id}]"
+                logger.info(f"{prefix} Transaction ID: {tx_id}")
+                logger.info(f"{prefix} Block height: {tx_info['height']}")
+
+            self.__save_result(index, machine_id, result)
 
     def __run_direct_mapping(self):
         """Run the mapping process for each machine and sample.
@@ -144,6 +188,9 @@ class RunPipeline:
         """
         total_samples = len(self.dataset)
 
+        # With the blockchain enabled, the samples of a day are pushed together
+        day_results = []
+
         for index, machine_id, source, target in self.dataset:
             prefix = f"[{index + 1:03}/{total_samples}: {machine_id}]"
 
@@ -156,30 +203,24 @@ class RunPipeline:
             mapping_result = self.llm_mapping(template_vars, source)
             result["llm_mapping"] = mapping_result
 
-            parsed = mapping_result.get("response_parsed", None)
-
-            if parsed is not None and self.args.blockchain:
-                logger.info(f"{prefix} Pushing to blockchain")
-                blockchain_time_start = time.time()
-
-                tx_id, block = self.__push_to_blockchain(machine_id, parsed)
-
-                result["blockchain_time"] = time.time() - blockchain_time_start
-                logger.info(f"{prefix} Transaction ID: {tx_id}")
-                logger.info(f"{prefix} Block height: {block}")
-
             result["total_time"] = time.time() - sample_time_start
 
-            file_path = os.path.join(self.raw_results_dir, f"{machine_id}.jsonl")
-            with open(file_path, "a") as f:
-                f.write(json.dumps(result) + "\n")
+            if not self.args.blockchain:
+                self.__save_result(index, machine_id, result)
+                continue
 
-            self.__save_last_index(index)
+            day_results.append((index, machine_id, result))
+
+            if self.dataset.is_last_machine():
+                self.__push_to_blockchain(day_results)
+                day_results = []
 
-            if self.args.blockchain and self.dataset.is_last_machine():
                 logger.info(f"Aggregating metrics for date: {target['date']}")
                 self.waves_connector.call_aggregate_metrics(target["date"])
 
+        if day_results:
+            self.__push_to_blockchain(day_results)
+
     def __run_function_mapping(self):
         """Run the mapping process once for each machine using the `mapping-function` prompt.
 